@@ -0,0 +1,194 @@
+"""Re-run OCR + NLP extraction for stored documents.
+
+Walks `documents` in doc_id (keyset) order, re-extracts each file on a worker
+pool and replaces its ai_extracted_info rows in one transaction. Progress is
+checkpointed after every batch so an interrupted run resumes where it stopped.
+Each document is re-extracted with its doc_type's extraction profile.
+
+Usage:
+    python reprocess.py --workers 2 --batch-size 50 --max-rate 5
+    python reprocess.py --restart          # ignore the checkpoint
+    python reprocess.py --retry-failed     # re-attempt docs that failed earlier, then resume
+"""
+import os
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from app import get_mysql, run_extraction_pipeline, replace_extractions
+
+
+def load_checkpoint(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"last_doc_id": 0, "processed": 0, "failed": []}
+
+
+def save_checkpoint(path, state):
+    """Write the checkpoint atomically so a crash never leaves it half-written"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def fetch_batch(after_doc_id, batch_size):
+    conn = None
+    cursor = None
+    try:
+        conn = get_mysql()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("""
+            SELECT doc_id, doc_type, file_path FROM documents
+            WHERE doc_id > %s
+            ORDER BY doc_id
+            LIMIT %s
+        """, (after_doc_id, batch_size))
+        return cursor.fetchall()
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+
+def fetch_by_ids(doc_ids):
+    conn = None
+    cursor = None
+    try:
+        conn = get_mysql()
+        cursor = conn.cursor(dictionary=True)
+        placeholders = ','.join(['%s'] * len(doc_ids))
+        cursor.execute(f"""
+            SELECT doc_id, doc_type, file_path FROM documents
+            WHERE doc_id IN ({placeholders})
+            ORDER BY doc_id
+        """, doc_ids)
+        return cursor.fetchall()
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+
+def reprocess_document(doc):
+    """Re-extract one document; returns (doc_id, error or None)"""
+    conn = None
+    try:
+        if not doc['file_path'] or not os.path.isfile(doc['file_path']):
+            return doc['doc_id'], "file missing"
+
+        _, results, _ = run_extraction_pipeline(doc['file_path'], doc['doc_type'])
+
+        conn = get_mysql()
+        replace_extractions(conn, doc['doc_id'], results)
+        return doc['doc_id'], None
+    except Exception as e:
+        return doc['doc_id'], str(e)
+    finally:
+        if conn:
+            conn.close()
+
+
+class Pacer:
+    """Spaces submissions so a run never exceeds max_rate docs/sec (0 = unlimited)"""
+
+    def __init__(self, max_rate):
+        self.interval = 1.0 / max_rate if max_rate > 0 else 0
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if self.next_slot > now:
+            time.sleep(self.next_slot - now)
+        self.next_slot = max(self.next_slot, now) + self.interval
+
+
+def reprocess_paced(pool, pacer, docs):
+    """Submit docs at the paced rate; returns (doc_id, error) in submission order"""
+    futures = []
+    for doc in docs:
+        pacer.wait()
+        futures.append(pool.submit(reprocess_document, doc))
+    return [future.result() for future in futures]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract stored documents")
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--batch-size', type=int, default=50)
+    parser.add_argument('--max-rate', type=float, default=0,
+                        help="Max documents per second across all workers (0 = unlimited)")
+    parser.add_argument('--checkpoint', default='reprocess_checkpoint.json')
+    parser.add_argument('--restart', action='store_true', help="Ignore any existing checkpoint")
+    parser.add_argument('--retry-failed', action='store_true',
+                        help="Re-attempt documents recorded as failed before resuming")
+    args = parser.parse_args()
+
+    state = {"last_doc_id": 0, "processed": 0, "failed": []} if args.restart \
+        else load_checkpoint(args.checkpoint)
+    if state["last_doc_id"]:
+        print(f"↩️  Resuming after doc_id {state['last_doc_id']}")
+
+    pacer = Pacer(args.max_rate)
+    started = time.monotonic()
+    done_this_run = 0
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        # Failed docs sit behind the keyset checkpoint, so resuming alone never revisits them
+        if args.retry_failed and state["failed"]:
+            print(f"🔁 Retrying {len(state['failed'])} previously failed docs")
+            still_failed = []
+            for start in range(0, len(state["failed"]), args.batch_size):
+                ids = state["failed"][start:start + args.batch_size]
+                docs = fetch_by_ids(ids)
+                # Docs deleted since the failure simply drop out of the list
+                for doc_id, error in reprocess_paced(pool, pacer, docs):
+                    if error:
+                        print(f"❌ doc {doc_id}: {error}")
+                        still_failed.append(doc_id)
+                    else:
+                        state["processed"] += 1
+                done_this_run += len(docs)
+            state["failed"] = still_failed
+            save_checkpoint(args.checkpoint, state)
+
+        while True:
+            batch = fetch_batch(state["last_doc_id"], args.batch_size)
+            if not batch:
+                break
+
+            for doc_id, error in reprocess_paced(pool, pacer, batch):
+                if error:
+                    print(f"❌ doc {doc_id}: {error}")
+                    state["failed"].append(doc_id)
+                else:
+                    state["processed"] += 1
+
+            # Only advance once the whole batch is finished, so a crash mid-batch
+            # re-runs it (replacement is idempotent)
+            state["last_doc_id"] = batch[-1]["doc_id"]
+            done_this_run += len(batch)
+            save_checkpoint(args.checkpoint, state)
+
+            elapsed = time.monotonic() - started
+            print(f"📄 {done_this_run} docs this run, up to doc_id {state['last_doc_id']} "
+                  f"({done_this_run / elapsed:.2f} docs/sec)")
+
+    elapsed = time.monotonic() - started
+    rate = done_this_run / elapsed if elapsed else 0.0
+    print(f"✅ Reprocessing complete: {done_this_run} docs in {elapsed:.1f}s "
+          f"({rate:.2f} docs/sec), {state['processed']} succeeded in total, "
+          f"{len(state['failed'])} failed")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 import React, { useState } from "react";
 import { Routes, Route, Navigate } from "react-router-dom";
+import axios from "axios";
 import Topbar from "./Topbar";
 import Footer from "./Footer";
 import Home from "../pages/Home";
@@ -14,7 +15,11 @@ import NotFound from "../pages/NotFound";
 export default function AppShell() {
   const [user, setUser] = useState(() => {
     try {
-      return JSON.parse(localStorage.getItem("dv_user"));
+      const stored = JSON.parse(localStorage.getItem("dv_user"));
+      if (stored?.token) {
+        axios.defaults.headers.common.Authorization = `Bearer ${stored.token}`;
+      }
+      return stored;
     } catch {
       return null;
     }
@@ -22,6 +27,7 @@ export default function AppShell() {
 
   const handleLogout = () => {
     localStorage.removeItem("dv_user");
+    delete axios.defaults.headers.common.Authorization;
     setUser(null);
   };
 
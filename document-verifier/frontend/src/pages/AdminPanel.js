@@ -5,26 +5,103 @@ export default function AdminPanel({ user }) {
   const [pending, setPending] = useState([]);
 
   useEffect(() => {
-    fetchPending();
-  }, []);
+    let source = null;
+    let closed = false;
+    let lastEventId = "";
+
+    const open = (streamToken) => {
+      if (closed) return;
+      source = new EventSource(
+        `http://127.0.0.1:5000/admin/pending/stream?stream_token=${encodeURIComponent(
+          streamToken
+        )}&last_event_id=${encodeURIComponent(lastEventId)}`
+      );
+      const track = (e) => {
+        if (e.lastEventId) lastEventId = e.lastEventId;
+      };
+      source.addEventListener("pending", (e) => {
+        track(e);
+        const doc = JSON.parse(e.data);
+        setPending((prev) =>
+          prev.some((p) => p.doc_id === doc.doc_id) ? prev : [doc, ...prev]
+        );
+      });
+      source.addEventListener("status", (e) => {
+        track(e);
+        const { doc_id, status } = JSON.parse(e.data);
+        if (status !== "pending") {
+          setPending((prev) => prev.filter((p) => p.doc_id !== doc_id));
+        }
+      });
+      source.addEventListener("reset", (e) => {
+        track(e);
+        fetchPending();
+      });
+      // Stream tokens are short-lived: reconnect with a fresh one from where we left off
+      source.addEventListener("expired", () => reconnect());
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED) setTimeout(reconnect, 2000);
+      };
+    };
+
+    const reconnect = async () => {
+      if (source) source.close();
+      if (closed) return;
+      try {
+        const res = await axios.get(
+          "http://127.0.0.1:5000/admin/pending/stream_token"
+        );
+        open(res.data.stream_token);
+      } catch (err) {
+        console.error(err);
+      }
+    };
+
+    // One full load, then apply pushed deltas instead of re-polling the list
+    const subscribe = async () => {
+      const data = await fetchPending();
+      if (!data) return;
+      lastEventId = data.last_event_id || "";
+      open(data.stream_token);
+    };
+    subscribe();
+
+    return () => {
+      closed = true;
+      if (source) source.close();
+    };
+  }, [user.token]);
 
   const fetchPending = async () => {
     try {
       const res = await axios.get("http://127.0.0.1:5000/admin/pending");
       setPending(res.data.pending_documents || []);
+      return res.data;
     } catch (err) {
       console.error(err);
+      return null;
+    }
+  };
+
+  // Signed URLs are short-lived, so fetch a fresh one when the preview is opened
+  const openPreview = async (doc_id) => {
+    try {
+      const res = await axios.get(
+        `http://127.0.0.1:5000/document/${doc_id}/signed_url`
+      );
+      window.open(`http://127.0.0.1:5000${res.data.preview_url}`, "_blank", "noreferrer");
+    } catch (err) {
+      alert("Preview unavailable");
     }
   };
 
   const handleAction = async (doc_id, status) => {
     try {
       await axios.post(`http://127.0.0.1:5000/admin/verify/${doc_id}`, {
-        admin_id: user.user_id,
         status,
         remarks: status === "verified" ? "Approved" : "Rejected",
       });
-      fetchPending();
+      setPending((prev) => prev.filter((p) => p.doc_id !== doc_id));
       alert("Action taken");
     } catch (err) {
       alert("Action failed");
@@ -42,6 +119,7 @@ export default function AdminPanel({ user }) {
             <thead>
               <tr>
                 <th>ID</th>
+                <th>Preview</th>
                 <th>Name</th>
                 <th>User</th>
                 <th>Uploaded</th>
@@ -52,6 +130,15 @@ export default function AdminPanel({ user }) {
               {pending.map((p) => (
                 <tr key={p.doc_id}>
                   <td>{p.doc_id}</td>
+                  <td>
+                    <img
+                      className="doc-thumb"
+                      src={`http://127.0.0.1:5000/document/${p.doc_id}/preview?size=thumb&sig=${encodeURIComponent(p.preview_sig)}`}
+                      alt={p.doc_name}
+                      loading="lazy"
+                      onClick={() => openPreview(p.doc_id)}
+                    />
+                  </td>
                   <td>{p.doc_name}</td>
                   <td>{p.user_id}</td>
                   <td>{new Date(p.upload_date).toLocaleString()}</td>
@@ -15,6 +15,7 @@ export default function Login({ onLogin }) {
         password,
       });
       const user = res.data.user;
+      axios.defaults.headers.common.Authorization = `Bearer ${user.token}`;
       localStorage.setItem("dv_user", JSON.stringify(user));
       onLogin(user);
       navigate("/dashboard");
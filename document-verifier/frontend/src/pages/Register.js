@@ -23,6 +23,7 @@ export default function Register({ onRegister }) {
         password,
       });
       const user = loginRes.data.user;
+      axios.defaults.headers.common.Authorization = `Bearer ${user.token}`;
       localStorage.setItem("dv_user", JSON.stringify(user));
       onRegister(user);
       navigate("/dashboard");
@@ -14,7 +14,6 @@ export default function Upload({ user }) {
     try {
       const fd = new FormData();
       fd.append("file", file);
-      fd.append("user_id", user.user_id || 1);
       fd.append("doc_type", docType);
 
       const res = await axios.post("http://127.0.0.1:5000/upload", fd, {